@@ -1,26 +1,119 @@
+import copy
 import warnings
-from itertools import zip_longest
-from typing import Any, List, Optional, Tuple, Union, cast
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
 
 import torch
-
-from kornia.augmentation import GeometricAugmentationBase2D, IntensityAugmentationBase2D, RandomErasing
+import torch.nn as nn
+
+from kornia.augmentation import (
+    GeometricAugmentationBase2D,
+    IntensityAugmentationBase2D,
+    MixAugmentationBase,
+    RandomErasing,
+)
 from kornia.augmentation.base import _AugmentationBase
 from kornia.augmentation.container.base import SequentialBase
 from kornia.augmentation.container.image import ImageSequential, ParamItem
 from kornia.augmentation.container.patch import PatchSequential
-from kornia.augmentation.container.utils import ApplyInverse
+from kornia.augmentation.container.utils import ApplyInverse, ApplyInverseInterface
 from kornia.augmentation.container.video import VideoSequential
 from kornia.constants import DataKey
-from kornia.geometry.boxes import Boxes
+from kornia.geometry.boxes import BoxesView
 
 __all__ = ["AugmentationSequential"]
 
+# Dispatch codes of the submodules. They are computed once per module to avoid walking the ``isinstance``
+# ladder for every (module, data_key) pair on each call.
+_INTENSITY_NOOP = 0
+_GEOMETRIC = 1
+_VIDEO_WRAP = 2
+_PATCH_ERR = 3
+_SEQ_ERR = 4
+_NOT_IMPLEMENTED = 5
+
+# Box formats of the bbox data keys.
+_BBOX_MODES: Dict[DataKey, str] = {
+    DataKey.BBOX: "vertices_plus",
+    DataKey.BBOX_XYXY: "xyxy",
+    DataKey.BBOX_XYWH: "xywh",
+}
+
+# Data keys transformed as (B, N, 2) points by the geometric transformations.
+_POINT_KEYS = frozenset({DataKey.BBOX, DataKey.BBOX_XYXY, DataKey.BBOX_XYWH, DataKey.KEYPOINTS})
+# Data keys passed to the transformations as they are.
+_TENSOR_KEYS = frozenset({DataKey.INPUT, DataKey.MASK, DataKey.KEYPOINTS})
+# Data keys resampled as images, which are not flattened by the VideoSequential wrap.
+_IMAGE_KEYS = frozenset({DataKey.INPUT, DataKey.MASK})
+
+# Side CUDA streams used to overlap the independent data keys, per device.
+_AUX_STREAMS: Dict[torch.device, List["torch.cuda.Stream"]] = {}
+
 AugmentationSequentialInput = Union[
-    torch.Tensor, List[torch.Tensor], Tuple[torch.Tensor, torch.Tensor], Tuple[List[torch.Tensor], torch.Tensor]
+    torch.Tensor,
+    List[torch.Tensor],
+    Tuple[torch.Tensor, torch.Tensor],
+    Tuple[List[torch.Tensor], torch.Tensor],
+    BoxesView,
 ]
 
 
+def _get_module_opcode(module: nn.Module) -> int:
+    """Get the dispatch code of a module for the non-input data keys."""
+    if isinstance(module, IntensityAugmentationBase2D) and not isinstance(module, RandomErasing):
+        return _INTENSITY_NOOP
+    if isinstance(module, ImageSequential) and module.is_intensity_only():
+        return _INTENSITY_NOOP
+    if isinstance(module, VideoSequential):
+        return _VIDEO_WRAP
+    if isinstance(module, PatchSequential):
+        return _PATCH_ERR
+    if isinstance(module, (GeometricAugmentationBase2D, ImageSequential, RandomErasing)):
+        return _GEOMETRIC
+    if isinstance(module, (SequentialBase,)):
+        return _SEQ_ERR
+    return _NOT_IMPLEMENTED
+
+
+def _to_geometric_input(input: Any, dcate: DataKey) -> Any:
+    """Expand the boxes to vertices and promote integer masks to float for the geometric transformations.
+
+    Masks are kept in their native dtype until a geometric transformation actually needs to resample them.
+    """
+    if isinstance(input, (BoxesView,)):
+        return input.ensure_vertices()
+    if dcate == DataKey.MASK and isinstance(input, torch.Tensor) and not input.is_floating_point():
+        return input.to(torch.get_default_dtype())
+    return input
+
+
+def _restore_mask_dtype(output: Any, arg: Any) -> Any:
+    """Cast a mask promoted by :func:`_to_geometric_input` back to the dtype it was given in."""
+    if isinstance(arg, torch.Tensor) and not arg.is_floating_point() and output.dtype != arg.dtype:
+        return output.round().to(arg.dtype)
+    return output
+
+
+class _NullContext:
+    """No-op context manager, as ``contextlib.nullcontext`` is not available on Python 3.6."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: Any) -> bool:
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+def _stream_context(stream: Optional["torch.cuda.Stream"]) -> Any:
+    """Enter ``stream`` if any, skipping the cost of ``torch.cuda.stream`` for the CPU and single lane cases."""
+    if stream is None:
+        return _NULL_CONTEXT
+    return torch.cuda.stream(stream)
+
+
 class AugmentationSequential(ImageSequential):
     r"""AugmentationSequential for handling multiple input types like inputs, masks, keypoints at once.
 
@@ -46,6 +139,15 @@ class AugmentationSequential(ImageSequential):
             If (a, b), x number of transformations (a <= x <= b) will be selected.
             If True, the whole list of args will be processed as a sequence in a random order.
             If False, the whole list of args will be processed as a sequence in original order.
+        random_apply_weights: a list of selection weights for each operation. The length shall be as
+            same as the number of operations. By default, operations are sampled uniformly.
+        prefetch_to_device: if set, CPU tensors and labels are moved to this device before being augmented. When it is a
+            CUDA device, the tensors in pinned memory (e.g. from a ``DataLoader`` with ``pin_memory=True``) are
+            copied asynchronously.
+        outputs_as_boxes: if ``True``, bounding boxes are returned as :class:`~kornia.geometry.boxes.BoxesView`
+            instead of tensors, deferring the conversion back to their format until
+            :meth:`~kornia.geometry.boxes.BoxesView.to_output_mode` is called. They can be passed to
+            :meth:`inverse` straight-away.
 
     .. note::
         Mix augmentations (e.g. RandomMixUp, RandomCutMix) can only be working with "input" data key.
@@ -143,6 +245,8 @@ class AugmentationSequential(ImageSequential):
         keepdim: Optional[bool] = None,
         random_apply: Union[int, bool, Tuple[int, int]] = False,
         random_apply_weights: Optional[List[float]] = None,
+        prefetch_to_device: Optional[torch.device] = None,
+        outputs_as_boxes: bool = False,
     ) -> None:
         super().__init__(
             *args,
@@ -154,6 +258,8 @@ class AugmentationSequential(ImageSequential):
         )
 
         self.data_keys = [DataKey.get(inp) for inp in data_keys]
+        self.prefetch_to_device = None if prefetch_to_device is None else torch.device(prefetch_to_device)
+        self.outputs_as_boxes = outputs_as_boxes
 
         if not all(in_type in DataKey for in_type in self.data_keys):
             raise AssertionError(f"`data_keys` must be in {DataKey}. Got {data_keys}.")
@@ -168,21 +274,231 @@ class AugmentationSequential(ImageSequential):
             if isinstance(arg, VideoSequential):
                 self.contains_video_sequential = True
 
+        self._module_cache_key: Tuple[Tuple[str, nn.Module], ...] = ()
+        self._refresh_module_cache()
+        self._dispatch_table: Dict[Tuple[int, DataKey], Callable] = {}
+        self._inverse_dispatch_table: Dict[Tuple[int, DataKey], Callable] = {}
+        for dcate in DataKey:
+            for opcode in (_INTENSITY_NOOP, _GEOMETRIC, _VIDEO_WRAP, _PATCH_ERR, _SEQ_ERR, _NOT_IMPLEMENTED):
+                self._dispatch_table[(opcode, dcate)] = self._get_apply_func(opcode, dcate)
+                self._inverse_dispatch_table[(opcode, dcate)] = self._get_inverse_func(opcode, dcate)
+
+    def _refresh_module_cache(self) -> None:
+        """Cache the per-module lookups, rebuilt whenever the children are added, replaced or removed."""
+        self._module_cache_key = tuple(self._modules.items())
+        self._name_to_module: Dict[str, nn.Module] = dict(self.named_children())
+        self._module_opcodes: Dict[str, int] = {
+            name: _get_module_opcode(module) for name, module in self._name_to_module.items()
+        }
+        # Only pipelines holding a mix augmentation need to scan the params for label operations.
+        self._has_label_ops: bool = any(
+            isinstance(module, (MixAugmentationBase,)) for module in self._name_to_module.values()
+        )
+        # Data keys that no module in the pipeline would touch, e.g. masks and boxes of intensity-only pipelines.
+        self._noop_keys: Set[DataKey] = set()
+        if all(opcode == _INTENSITY_NOOP for opcode in self._module_opcodes.values()):
+            self._noop_keys = {dcate for dcate in DataKey if dcate != DataKey.INPUT}
+
+    def _ensure_module_cache(self) -> None:
+        if self._module_cache_key != tuple(self._modules.items()):
+            self._refresh_module_cache()
+
+    def _get_apply_func(self, opcode: int, dcate: DataKey) -> Callable:
+        if dcate == DataKey.INPUT:
+            return self._apply_input
+        if opcode == _INTENSITY_NOOP:
+            return self._apply_noop
+        if opcode == _VIDEO_WRAP and dcate not in _IMAGE_KEYS:
+            return partial(self._apply_video_wrap, ApplyInverse._get_func_by_key(dcate))
+        if opcode in (_GEOMETRIC, _VIDEO_WRAP):
+            return partial(self._apply_geometric, ApplyInverse._get_func_by_key(dcate))
+        return partial(self._apply_unsupported, opcode)
+
+    def _get_inverse_func(self, opcode: int, dcate: DataKey) -> Callable:
+        if opcode == _INTENSITY_NOOP:
+            return self._inverse_noop
+        if opcode == _VIDEO_WRAP and dcate not in _IMAGE_KEYS:
+            return partial(self._inverse_video_wrap, ApplyInverse._get_func_by_key(dcate))
+        if opcode in (_GEOMETRIC, _VIDEO_WRAP):
+            return partial(self._inverse_geometric, ApplyInverse._get_func_by_key(dcate))
+        return partial(self._inverse_unsupported, opcode)
+
+    def _raise_unsupported(self, opcode: int, module: nn.Module, dcate: DataKey) -> None:
+        if opcode == _PATCH_ERR:
+            raise NotImplementedError("Geometric involved PatchSequential is not supported.")
+        if opcode == _SEQ_ERR:
+            raise ValueError(f"Unsupported Sequential {module}.")
+        raise NotImplementedError(f"data_key {dcate} is not implemented for {module}.")
+
+    def _apply_unsupported(
+        self,
+        opcode: int,
+        input: Any,
+        label: Optional[torch.Tensor],
+        module: nn.Module,
+        param: ParamItem,
+        dcate: DataKey,
+    ) -> Tuple[Any, Optional[torch.Tensor]]:
+        self._raise_unsupported(opcode, module, dcate)
+        return input, label
+
+    def _inverse_unsupported(
+        self, opcode: int, input: torch.Tensor, module: nn.Module, param: Optional[ParamItem], dcate: DataKey
+    ) -> torch.Tensor:
+        self._raise_unsupported(opcode, module, dcate)
+        return input
+
+    def _apply_input(
+        self, input: Any, label: Optional[torch.Tensor], module: nn.Module, param: ParamItem, dcate: DataKey
+    ) -> Tuple[Any, Optional[torch.Tensor]]:
+        return self.apply_to_input(input, label, module=module, param=param)
+
+    def _apply_noop(
+        self, input: Any, label: Optional[torch.Tensor], module: nn.Module, param: ParamItem, dcate: DataKey
+    ) -> Tuple[Any, Optional[torch.Tensor]]:
+        return input, label
+
+    def _apply_video_wrap(
+        self,
+        func: Type[ApplyInverseInterface],
+        input: Any,
+        label: Optional[torch.Tensor],
+        module: nn.Module,
+        param: ParamItem,
+        dcate: DataKey,
+    ) -> Tuple[Any, Optional[torch.Tensor]]:
+        input = _to_geometric_input(input, dcate)
+        batch_size: int = input.size(0)
+        input = input.flatten(0, 1)
+        input, label = func.apply_trans(input, label, module=module, param=param)
+        input = input.unflatten(0, (batch_size, input.shape[0] // batch_size))
+        return input, label
+
+    def _apply_geometric(
+        self,
+        func: Type[ApplyInverseInterface],
+        input: Any,
+        label: Optional[torch.Tensor],
+        module: nn.Module,
+        param: ParamItem,
+        dcate: DataKey,
+    ) -> Tuple[Any, Optional[torch.Tensor]]:
+        input = _to_geometric_input(input, dcate)
+        return func.apply_trans(input, label, module=module, param=param)
+
+    def _get_key_streams(self, inputs: List[Any], data_keys: List[DataKey]) -> List[Optional["torch.cuda.Stream"]]:
+        """Get a side CUDA stream per data key so that the independent data keys overlap on the GPU.
+
+        Boxes and keypoints share a stream since they may be transformed together. The streams are ``None`` when the
+        data is not on a CUDA device or when there is nothing to overlap.
+        """
+        lanes: List[int] = [0 if dcate in _POINT_KEYS else j + 1 for j, dcate in enumerate(data_keys)]
+        unique_lanes: List[int] = sorted(set(lanes))
+        if len(unique_lanes) < 2:
+            return [None] * len(inputs)
+
+        device: Optional[torch.device] = None
+        for inp in inputs:
+            data = inp._boxes if isinstance(inp, (BoxesView,)) else inp
+            if isinstance(data, torch.Tensor):
+                device = data.device
+                break
+        if device is None or device.type != "cuda":
+            return [None] * len(inputs)
+
+        streams = _AUX_STREAMS.setdefault(device, [])
+        while len(streams) < len(unique_lanes):
+            streams.append(torch.cuda.Stream(device=device))
+        return [streams[unique_lanes.index(lane)] for lane in lanes]
+
+    def _get_fusable_points(self, inputs: List[Any], point_js: List[int]) -> List[int]:
+        """Get the positions in ``point_js`` of the boxes and keypoints of ``inputs`` that can be transformed at once.
+
+        The boxes are expanded to vertices in place. None of them is returned if the tensors cannot be batched.
+        """
+        for j in point_js:
+            if isinstance(inputs[j], (BoxesView,)):
+                inputs[j] = inputs[j].ensure_vertices()
+        points = [inputs[j] for j in point_js]
+        ref = points[0]
+        if not all(
+            isinstance(p, torch.Tensor)
+            and (p.shape[0], p.dtype, p.device) == (ref.shape[0], ref.dtype, ref.device)
+            for p in points
+        ):
+            return []
+        return point_js
+
+    def _apply_geometric_to_points(
+        self,
+        inputs: List[Any],
+        point_js: List[int],
+        label: Optional[torch.Tensor],
+        modules: List[Tuple[nn.Module, ParamItem]],
+    ) -> Optional[torch.Tensor]:
+        """Transform the boxes and keypoints at ``point_js`` of ``inputs`` with a run of geometric modules."""
+        outputs, label = ApplyInverse.apply_to_points([inputs[j] for j in point_js], label, modules)
+        for j, out in zip(point_js, outputs):
+            inputs[j] = out
+        return label
+
+    def _inverse_noop(
+        self, input: torch.Tensor, module: nn.Module, param: Optional[ParamItem], dcate: DataKey
+    ) -> torch.Tensor:
+        return input
+
+    def _inverse_video_wrap(
+        self,
+        func: Type[ApplyInverseInterface],
+        input: torch.Tensor,
+        module: nn.Module,
+        param: Optional[ParamItem],
+        dcate: DataKey,
+    ) -> torch.Tensor:
+        input = _to_geometric_input(input, dcate)
+        batch_size: int = input.size(0)
+        input = input.flatten(0, 1)
+        input = func.inverse(input, module, param)
+        input = input.unflatten(0, (batch_size, input.shape[0] // batch_size))
+        return input
+
+    def _inverse_geometric(
+        self,
+        func: Type[ApplyInverseInterface],
+        input: torch.Tensor,
+        module: nn.Module,
+        param: Optional[ParamItem],
+        dcate: DataKey,
+    ) -> torch.Tensor:
+        input = _to_geometric_input(input, dcate)
+        return func.inverse(input, module, param)
+
+    def _normalize_params(
+        self, params: List[ParamItem], sequence: List[Tuple[str, nn.Module]]
+    ) -> List[Optional[ParamItem]]:
+        """Align the parameters with the module sequence, dropping those of non-augmentation modules."""
+        return [
+            param if isinstance(module, (_AugmentationBase, ImageSequential)) else None
+            for (_, module), param in zip(sequence, params)
+        ]
+
     def inverse(  # type: ignore
         self,
-        *args: torch.Tensor,
+        *args: Union[torch.Tensor, BoxesView],
         params: Optional[List[ParamItem]] = None,
         data_keys: Optional[List[Union[str, int, DataKey]]] = None,
-    ) -> Union[torch.Tensor, List[torch.Tensor]]:
+    ) -> Union[torch.Tensor, BoxesView, List[Union[torch.Tensor, BoxesView]]]:
         """Reverse the transformation applied.
 
         Number of input tensors must align with the number of``data_keys``. If ``data_keys`` is not set, use
         ``self.data_keys`` by default.
         """
+        _data_keys: List[DataKey]
         if data_keys is None:
             data_keys = cast(List[Union[str, int, DataKey]], self.data_keys)
-
-        _data_keys: List[DataKey] = [DataKey.get(inp) for inp in data_keys]
+            _data_keys = self.data_keys
+        else:
+            _data_keys = [DataKey.get(inp) for inp in data_keys]
 
         if len(args) != len(data_keys):
             raise AssertionError(
@@ -190,6 +506,7 @@ class AugmentationSequential(ImageSequential):
                 f"Got {len(args)} and {len(data_keys)}."
             )
 
+        self._ensure_module_cache()
         args = self._arguments_preproc(*args, data_keys=_data_keys)
 
         if params is None:
@@ -200,50 +517,53 @@ class AugmentationSequential(ImageSequential):
                 )
             params = self._params
 
-        outputs: List[torch.Tensor] = [None] * len(data_keys)  # type: ignore
-        for idx, (arg, dcate) in enumerate(zip(args, data_keys)):
+        # The reversed module sequence is the same for every data key.
+        reversed_seq = list(self.get_forward_sequence(params))[::-1]
+        reversed_params = self._normalize_params(params[::-1], reversed_seq)
+
+        outputs: List[Union[torch.Tensor, BoxesView]] = [None] * len(data_keys)  # type: ignore
+        box_idx: List[int] = []
+        for idx, (arg, dcate) in enumerate(zip(args, _data_keys)):
             if dcate == DataKey.INPUT and isinstance(arg, (tuple, list)):
                 input, _ = arg  # ignore the transformation matrix whilst inverse
-            # Using tensors straight-away
-            elif isinstance(arg, (Boxes,)):
-                input = arg.data  # all boxes are in (B, N, 4, 2) format now.
             else:
+                # Boxes are expanded to (B, N, 4, 2) lazily by the geometric transformations.
                 input = arg
-            for (name, module), param in zip_longest(list(self.get_forward_sequence(params))[::-1], params[::-1]):
-                if isinstance(module, (_AugmentationBase, ImageSequential)):
-                    param = params[name] if name in params else param
-                else:
-                    param = None
-                if isinstance(module, IntensityAugmentationBase2D) and dcate in DataKey \
-                        and not isinstance(module, RandomErasing):
-                    pass  # Do nothing
-                elif isinstance(module, ImageSequential) and module.is_intensity_only() and dcate in DataKey:
-                    pass  # Do nothing
-                elif isinstance(module, VideoSequential) and dcate not in [DataKey.INPUT, DataKey.MASK]:
-                    batch_size: int = input.size(0)
-                    input = input.view(-1, *input.shape[2:])
-                    input = ApplyInverse.inverse_by_key(input, module, param, dcate)
-                    input = input.view(batch_size, -1, *input.shape[1:])
-                elif isinstance(module, PatchSequential):
-                    raise NotImplementedError("Geometric involved PatchSequential is not supported.")
-                elif isinstance(module, (GeometricAugmentationBase2D, ImageSequential, RandomErasing)) \
-                        and dcate in DataKey:
-                    input = ApplyInverse.inverse_by_key(input, module, param, dcate)
-                elif isinstance(module, (SequentialBase,)):
-                    raise ValueError(f"Unsupported Sequential {module}.")
+            if dcate in self._noop_keys:
+                if isinstance(arg, (BoxesView,)):
+                    box_idx.append(idx)
                 else:
-                    raise NotImplementedError(f"data_key {dcate} is not implemented for {module}.")
-            if isinstance(arg, (Boxes,)):
-                arg._data = input
-                outputs[idx] = arg.to_tensor()
+                    outputs[idx] = input
+                continue
+            for (name, module), param in zip(reversed_seq, reversed_params):
+                opcode = self._module_opcodes[name]
+                if opcode == _INTENSITY_NOOP and dcate != DataKey.INPUT:
+                    continue
+                input = self._inverse_dispatch_table[(opcode, dcate)](input, module, param, dcate)
+            if isinstance(arg, (BoxesView,)):
+                if not isinstance(input, (BoxesView,)):
+                    arg.data = input
+                box_idx.append(idx)
+            elif dcate == DataKey.MASK:
+                outputs[idx] = _restore_mask_dtype(input, arg)
             else:
                 outputs[idx] = input
+        self._materialize_boxes(outputs, args, box_idx)
 
-        if len(outputs) == 1 and isinstance(outputs, (tuple, list)):
+        if len(outputs) == 1:
             return outputs[0]
 
         return outputs
 
+    def _materialize_boxes(self, outputs: List[Any], args: Sequence[Any], box_idx: List[int]) -> None:
+        """Fill ``outputs`` at ``box_idx`` with the boxes of ``args``, converted at once to their original format."""
+        if self.outputs_as_boxes:
+            for idx in box_idx:
+                outputs[idx] = args[idx]
+            return
+        for idx, out in zip(box_idx, BoxesView.batch_to_output_mode([args[idx] for idx in box_idx])):
+            outputs[idx] = out
+
     def __packup_output__(  # type: ignore
         self, output: List[AugmentationSequentialInput], label: Optional[torch.Tensor] = None
     ) -> Union[
@@ -252,6 +572,7 @@ class AugmentationSequential(ImageSequential):
         List[AugmentationSequentialInput],
         Tuple[List[AugmentationSequentialInput], Optional[torch.Tensor]],
     ]:
+        # ``ImageSequential.forward`` also packs up bare tensors, so only lists and tuples are unpacked.
         if len(output) == 1 and isinstance(output, (tuple, list)) and self.return_label:
             return output[0], label
         if len(output) == 1 and isinstance(output, (tuple, list)):
@@ -267,21 +588,29 @@ class AugmentationSequential(ImageSequential):
             )
         # TODO: validate args batching, and its consistency
 
+    def _prefetch(self, arg: Any) -> Any:
+        """Move the CPU tensors of ``arg`` to ``self.prefetch_to_device``."""
+        if isinstance(arg, (tuple, list)):
+            return type(arg)(self._prefetch(a) for a in arg)
+        if not isinstance(arg, torch.Tensor) or arg.device.type != "cpu":
+            return arg
+        # Only pinned host memory can be copied asynchronously. Pinning here would add a synchronous host copy.
+        non_blocking = self.prefetch_to_device.type == "cuda" and arg.is_pinned()  # type: ignore
+        return arg.to(self.prefetch_to_device, non_blocking=non_blocking)
+
     def _arguments_preproc(self, *args: AugmentationSequentialInput, data_keys: List[DataKey]):
         inp: List[Any] = []
         for arg, dcate in zip(args, data_keys):
-            if DataKey.get(dcate) in [DataKey.INPUT, DataKey.MASK, DataKey.KEYPOINTS]:
+            if self.prefetch_to_device is not None:
+                arg = self._prefetch(arg)
+            mode = _BBOX_MODES.get(dcate)
+            if isinstance(arg, (BoxesView,)):
+                # Boxes returned with ``outputs_as_boxes``. Copied so that the caller's view is left untouched.
+                inp.append(copy.copy(arg))
+            elif mode is not None:
+                inp.append(BoxesView(arg, mode=mode))  # type: ignore
+            elif dcate in _TENSOR_KEYS:
                 inp.append(arg)
-            elif DataKey.get(dcate) in [DataKey.BBOX, DataKey.BBOX_XYXY, DataKey.BBOX_XYWH]:
-                if DataKey.get(dcate) in [DataKey.BBOX]:
-                    mode = "vertices_plus"
-                elif DataKey.get(dcate) in [DataKey.BBOX_XYXY]:
-                    mode = "xyxy"
-                elif DataKey.get(dcate) in [DataKey.BBOX_XYWH]:
-                    mode = "xywh"
-                else:
-                    raise ValueError(f"Unsupported mode `{DataKey.get(dcate).name}`.")
-                inp.append(Boxes.from_tensor(arg, mode=mode))  # type: ignore
             else:
                 raise NotImplementedError(f"input type of {dcate} is not implemented.")
         return inp
@@ -307,7 +636,10 @@ class AugmentationSequential(ImageSequential):
             self.data_keys = _data_keys
         self._validate_args_datakeys(*args, data_keys=_data_keys)
 
+        self._ensure_module_cache()
         args = self._arguments_preproc(*args, data_keys=_data_keys)
+        if self.prefetch_to_device is not None:
+            label = self._prefetch(label)
 
         if params is None:
             # image data must exist if params is not provided.
@@ -330,56 +662,92 @@ class AugmentationSequential(ImageSequential):
                 raise ValueError("`params` must be provided whilst INPUT is not in data_keys.")
 
         outputs: List[AugmentationSequentialInput] = [None] * len(_data_keys)  # type: ignore
+        input_idx: Optional[int] = None
         # Forward the first image data to freeze the parameters.
         if DataKey.INPUT in _data_keys:
-            idx = _data_keys.index(DataKey.INPUT)
-            _inp = args[idx]
+            input_idx = _data_keys.index(DataKey.INPUT)
+            _inp = args[input_idx]
             _out = super().forward(_inp, label, params=params)  # type: ignore
             if self.return_label:
                 _input, label = cast(Tuple[AugmentationSequentialInput, torch.Tensor], _out)
             else:
                 _input = cast(AugmentationSequentialInput, _out)
-            outputs[idx] = _input
-
-        self.return_label = self.return_label or label is not None or self.contains_label_operations(params)
+            outputs[input_idx] = _input
 
-        for idx, (arg, dcate, out) in enumerate(zip(args, _data_keys, outputs)):
-            if out is not None:
-                continue
-            # Using tensors straight-away
-            if isinstance(arg, (Boxes,)):
-                input = arg.data  # all boxes are in (B, N, 4, 2) format now.
-            else:
-                input = arg
+        self.return_label = (
+            self.return_label
+            or label is not None
+            or (self._has_label_ops and self.contains_label_operations(params))
+        )
 
+        remaining_idx: List[int] = [idx for idx in range(len(_data_keys)) if idx != input_idx]
+        # Boxes are expanded to (B, N, 4, 2) lazily by the geometric transformations.
+        remaining: List[Any] = [args[idx] for idx in remaining_idx]
+
+        point_js: List[int] = [j for j, idx in enumerate(remaining_idx) if _data_keys[idx] in _POINT_KEYS]
+        # Boxes and keypoints go through consecutive geometric modules with a single composed matrix.
+        fused_js: Optional[List[int]] = None
+        run: List[Tuple[nn.Module, ParamItem]] = []
+
+        # Walk the modules once and apply each of them to all the remaining data keys.
+        if any(_data_keys[idx] not in self._noop_keys for idx in remaining_idx):
+            # Independent data keys are issued on their own CUDA streams, if any.
+            streams = self._get_key_streams(remaining, [_data_keys[idx] for idx in remaining_idx])
+            side_streams = list({id(stream): stream for stream in streams if stream is not None}.values())
+            point_stream = streams[point_js[0]] if point_js else None
+            if side_streams:
+                current_stream = torch.cuda.current_stream(side_streams[0].device)
+                for stream in side_streams:
+                    stream.wait_stream(current_stream)
+
+            has_inputs = any(_data_keys[idx] == DataKey.INPUT for idx in remaining_idx)
             for param in params:
-                module = self.get_submodule(param.name)
-                if dcate == DataKey.INPUT:
-                    input, label = self.apply_to_input(input, label, module=module, param=param)
-                elif isinstance(module, IntensityAugmentationBase2D) and dcate in DataKey \
-                        and not isinstance(module, RandomErasing):
-                    pass  # Do nothing
-                elif isinstance(module, ImageSequential) and module.is_intensity_only() and dcate in DataKey:
-                    pass  # Do nothing
-                elif isinstance(module, VideoSequential) and dcate not in [DataKey.INPUT, DataKey.MASK]:
-                    batch_size: int = input.size(0)
-                    input = input.view(-1, *input.shape[2:])
-                    input, label = ApplyInverse.apply_by_key(input, label, module, param, dcate)
-                    input = input.view(batch_size, -1, *input.shape[1:])
-                elif isinstance(module, PatchSequential):
-                    raise NotImplementedError("Geometric involved PatchSequential is not supported.")
-                elif isinstance(module, (GeometricAugmentationBase2D, ImageSequential, RandomErasing)) \
-                        and dcate in DataKey:
-                    input, label = ApplyInverse.apply_by_key(input, label, module, param, dcate)
-                elif isinstance(module, (SequentialBase,)):
-                    raise ValueError(f"Unsupported Sequential {module}.")
-                else:
-                    raise NotImplementedError(f"data_key {dcate} is not implemented for {module}.")
-
-            if isinstance(arg, (Boxes,)):
-                arg._data = input
-                outputs[idx] = arg.to_tensor()
+                opcode = self._module_opcodes[param.name]
+                if opcode == _INTENSITY_NOOP and not has_inputs:
+                    continue
+                module = self._name_to_module[param.name]
+                if opcode == _GEOMETRIC and point_js and fused_js is None:
+                    with _stream_context(point_stream):
+                        fused_js = self._get_fusable_points(remaining, point_js)
+                if opcode == _GEOMETRIC and fused_js:
+                    run.append((module, param))
+                elif run and opcode != _INTENSITY_NOOP:
+                    with _stream_context(point_stream):
+                        label = self._apply_geometric_to_points(remaining, cast(List[int], fused_js), label, run)
+                    run = []
+                for j, idx in enumerate(remaining_idx):
+                    if opcode == _GEOMETRIC and fused_js and j in fused_js:
+                        continue
+                    dcate = _data_keys[idx]
+                    if opcode == _INTENSITY_NOOP and dcate != DataKey.INPUT:
+                        continue
+                    with _stream_context(streams[j]):
+                        remaining[j], label = self._dispatch_table[(opcode, dcate)](
+                            remaining[j], label, module, param, dcate
+                        )
+            if run:
+                with _stream_context(point_stream):
+                    label = self._apply_geometric_to_points(remaining, cast(List[int], fused_js), label, run)
+
+            if side_streams:
+                for stream in side_streams:
+                    current_stream.wait_stream(stream)
+                # The outputs were allocated on the side streams but are consumed on the current one.
+                for input in remaining:
+                    if isinstance(input, torch.Tensor):
+                        input.record_stream(current_stream)
+
+        box_idx: List[int] = []
+        for idx, input in zip(remaining_idx, remaining):
+            arg = args[idx]
+            if isinstance(arg, (BoxesView,)):
+                if not isinstance(input, (BoxesView,)):
+                    arg.data = input
+                box_idx.append(idx)
+            elif _data_keys[idx] == DataKey.MASK:
+                outputs[idx] = _restore_mask_dtype(input, arg)
             else:
                 outputs[idx] = input
+        self._materialize_boxes(outputs, args, box_idx)
 
         return self.__packup_output__(outputs, label)
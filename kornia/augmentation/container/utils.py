@@ -551,6 +551,53 @@ class ApplyInverse:
             return (func.apply_trans(input[0], label, module, param), *input[1:])  # type: ignore
         return func.apply_trans(input, label, module=module, param=param)
 
+    @classmethod
+    def apply_to_points(
+        cls,
+        inputs: List[torch.Tensor],
+        label: Optional[torch.Tensor],
+        modules: List[Tuple[nn.Module, ParamItem]],
+    ) -> Tuple[List[torch.Tensor], Optional[torch.Tensor]]:
+        """Apply a run of transformations to several point-like tensors at once.
+
+        Boxes of shape :math:`(B, N, 4, 2)` and keypoints of shape :math:`(B, N, 2)` share the same transformation
+        matrices, so they are concatenated as :math:`(B, P, 2)` points. The matrices of the consecutive modules,
+        including their padding offsets, are composed into a single one and the points are transformed once.
+
+        Args:
+            inputs: the box and keypoint tensors with the same batch size, dtype and device.
+            label: the optional label tensor.
+            modules: the consecutive modules to apply, along with their parameters. Only kornia augmentation
+                modules will count to apply transformations.
+        """
+        points = torch.cat([inp.reshape(inp.shape[0], -1, 2) for inp in inputs], dim=1)
+        trans_mat: torch.Tensor = kornia.eye_like(3, points)
+
+        for module, param in modules:
+            # The transformation matrix is computed from the first tensor as ``apply_by_key`` would do.
+            mat: Optional[torch.Tensor] = BBoxApplyInverse._get_transformation(inputs[0], module, param)
+
+            padding_size = BBoxApplyInverse._get_padding_size(module, param)
+            if padding_size is not None:
+                padding_size = padding_size.to(points)
+                trans_mat[..., 0, :] += padding_size[..., None, 0] * trans_mat[..., 2, :]  # left padding
+                trans_mat[..., 1, :] += padding_size[..., None, 2] * trans_mat[..., 2, :]  # top padding
+
+            to_apply = None
+            if isinstance(module, _AugmentationBase):
+                to_apply = param.data['batch_prob']  # type: ignore
+            if isinstance(module, kornia.augmentation.ImageSequential):
+                to_apply = torch.ones(points.shape[0], device=points.device, dtype=points.dtype).bool()
+
+            if mat is not None and to_apply is not None and to_apply.sum() != 0:
+                trans_mat[to_apply] = mat.to(trans_mat) @ trans_mat[to_apply]
+
+        points = transform_points(trans_mat, points)
+
+        sizes: List[int] = [inp.shape[1:].numel() // 2 for inp in inputs]
+        outputs = [out.reshape(inp.shape) for out, inp in zip(points.split(sizes, dim=1), inputs)]
+        return outputs, label
+
     @classmethod
     def inverse_by_key(
         cls,
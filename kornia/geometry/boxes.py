@@ -1,11 +1,11 @@
-from typing import List, Optional, Tuple, Union, cast
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 import torch
 
 from kornia.geometry.bbox import validate_bbox
 from kornia.geometry.linalg import transform_points
 
-__all__ = ["Boxes", "Boxes3D"]
+__all__ = ["Boxes", "BoxesView", "Boxes3D"]
 
 
 def _is_floating_point_dtype(dtype: torch.dtype) -> bool:
@@ -75,22 +75,47 @@ def _boxes_to_polygons(
     return polygons
 
 
-def _boxes_to_quadrilaterals(
-    boxes: torch.Tensor, mode: str = "xyxy", validate_boxes: bool = True
-) -> torch.Tensor:
-    """Convert from boxes to quadrilaterals."""
+def _check_boxes(boxes: torch.Tensor, mode: str = "xyxy", validate_boxes: bool = True) -> bool:
+    """Check the shape of boxes in the ``mode`` format, and their sizes for the xy modes.
+
+    Returns whether the boxes are batched.
+    """
     mode = mode.lower()
 
     if mode.startswith("vertices"):
-        batched = boxes.ndim == 4
         if not (3 <= boxes.ndim <= 4 and boxes.shape[-2:] == torch.Size([4, 2])):
             raise ValueError(f"Boxes shape must be (N, 4, 2) or (B, N, 4, 2) when {mode} mode. Got {boxes.shape}.")
-    elif mode.startswith("xy"):
-        batched = boxes.ndim == 3
-        if not (2 <= boxes.ndim <= 3 and boxes.shape[-1] == 4):
-            raise ValueError(f"Boxes shape must be (N, 4) or (B, N, 4) when {mode} mode. Got {boxes.shape}.")
-    else:
+        return boxes.ndim == 4
+
+    if not mode.startswith("xy"):
         raise ValueError(f"Unknown mode {mode}")
+    if not (2 <= boxes.ndim <= 3 and boxes.shape[-1] == 4):
+        raise ValueError(f"Boxes shape must be (N, 4) or (B, N, 4) when {mode} mode. Got {boxes.shape}.")
+
+    if validate_boxes:
+        if mode == "xyxy":
+            height, width = boxes[..., 3] - boxes[..., 1], boxes[..., 2] - boxes[..., 0]
+        elif mode == "xyxy_plus":
+            height, width = boxes[..., 3] - boxes[..., 1] + 1, boxes[..., 2] - boxes[..., 0] + 1
+        elif mode == "xywh":
+            height, width = boxes[..., 3], boxes[..., 2]
+        else:
+            raise ValueError(f"Unknown mode {mode}")
+
+        if (width <= 0).any():
+            raise ValueError("Some boxes have negative widths or 0.")
+        if (height <= 0).any():
+            raise ValueError("Some boxes have negative heights or 0.")
+
+    return boxes.ndim == 3
+
+
+def _boxes_to_quadrilaterals(
+    boxes: torch.Tensor, mode: str = "xyxy", validate_boxes: bool = True
+) -> torch.Tensor:
+    """Convert from boxes to quadrilaterals."""
+    mode = mode.lower()
+    batched = _check_boxes(boxes, mode, validate_boxes)
 
     boxes = boxes if boxes.is_floating_point() else boxes.float()
     boxes = boxes if batched else boxes.unsqueeze(0)
@@ -114,12 +139,6 @@ def _boxes_to_quadrilaterals(
         else:
             raise ValueError(f"Unknown mode {mode}")
 
-        if validate_boxes:
-            if (width <= 0).any():
-                raise ValueError("Some boxes have negative widths or 0.")
-            if (height <= 0).any():
-                raise ValueError("Some boxes have negative heights or 0.")
-
         xmin, ymin = boxes[..., 0], boxes[..., 1]
         quadrilaterals = _boxes_to_polygons(xmin, ymin, width, height)
     else:
@@ -130,6 +149,34 @@ def _boxes_to_quadrilaterals(
     return quadrilaterals
 
 
+def _quadrilaterals_to_boxes(quadrilaterals: torch.Tensor, mode: str = "xyxy") -> torch.Tensor:
+    """Convert from a batch of quadrilaterals (B, N, 4, 2) to boxes in the ``mode`` format."""
+    # Create boxes in xyxy_plus format.
+    boxes = torch.stack([quadrilaterals.amin(dim=-2), quadrilaterals.amax(dim=-2)], dim=-2).view(
+        quadrilaterals.shape[0], quadrilaterals.shape[1], 4
+    )
+
+    mode = mode.lower()
+
+    if mode in ("xyxy", "xyxy_plus"):
+        pass
+    elif mode in ("xywh", "vertices", "vertices_plus"):
+        height, width = boxes[..., 3] - boxes[..., 1] + 1, boxes[..., 2] - boxes[..., 0] + 1
+        boxes[..., 2] = width
+        boxes[..., 3] = height
+    else:
+        raise ValueError(f"Unknown mode {mode}")
+
+    if mode in ("xyxy", "vertices"):
+        offset = torch.as_tensor([0, 0, 1, 1], device=boxes.device, dtype=boxes.dtype)
+        boxes = boxes + offset
+
+    if mode.startswith('vertices'):
+        boxes = _boxes_to_polygons(boxes[..., 0], boxes[..., 1], boxes[..., 2], boxes[..., 3])
+
+    return boxes
+
+
 def _boxes3d_to_polygons3d(
     xmin: torch.Tensor,
     ymin: torch.Tensor,
@@ -320,33 +367,11 @@ class Boxes:
         """
         batched_boxes = self._data if self._is_batched else self._data.unsqueeze(0)
 
-        boxes: Union[torch.Tensor, List[torch.Tensor]]
-
-        # Create boxes in xyxy_plus format.
-        boxes = torch.stack([batched_boxes.amin(dim=-2), batched_boxes.amax(dim=-2)], dim=-2).view(
-            batched_boxes.shape[0], batched_boxes.shape[1], 4
-        )
-
         if mode is None:
             mode = self.mode
 
-        mode = mode.lower()
-
-        if mode in ("xyxy", "xyxy_plus"):
-            pass
-        elif mode in ("xywh", "vertices", "vertices_plus"):
-            height, width = boxes[..., 3] - boxes[..., 1] + 1, boxes[..., 2] - boxes[..., 0] + 1
-            boxes[..., 2] = width
-            boxes[..., 3] = height
-        else:
-            raise ValueError(f"Unknown mode {mode}")
-
-        if mode in ("xyxy", "vertices"):
-            offset = torch.as_tensor([0, 0, 1, 1], device=boxes.device, dtype=boxes.dtype)
-            boxes = boxes + offset
-
-        if mode.startswith('vertices'):
-            boxes = _boxes_to_polygons(boxes[..., 0], boxes[..., 1], boxes[..., 2], boxes[..., 3])
+        boxes: Union[torch.Tensor, List[torch.Tensor]]
+        boxes = _quadrilaterals_to_boxes(batched_boxes, mode)
 
         if self._N is not None and not as_padded_sequence:
             boxes = list(torch.nn.functional.pad(
@@ -461,6 +486,95 @@ class Boxes:
         return self
 
 
+class BoxesView:
+    r"""Lazy 2D boxes wrapper used by the augmentation containers.
+
+    The boxes are kept in their original ``mode`` and only expanded to vertices of shape :math:`(N, 4, 2)` or
+    :math:`(B, N, 4, 2)` when a geometric transformation requires them, so that intensity-only pipelines never
+    pay for the conversion.
+
+    The shape of the boxes, and their sizes for the xy modes, are still checked eagerly as
+    :func:`Boxes.from_tensor` does.
+
+    Args:
+        boxes: 2D boxes in the ``mode`` format, or a list of unbatched ones.
+        mode: the box format of the input boxes. See :func:`Boxes.from_tensor`.
+    """
+    def __init__(self, boxes: Union[torch.Tensor, List[torch.Tensor]], mode: str = "xyxy") -> None:
+        if isinstance(boxes, (list,)):
+            if any(_check_boxes(box, mode) for box in boxes):
+                raise TypeError(f"Input boxes must be a list of unbatched boxes. Got: {[box.shape for box in boxes]}.")
+        else:
+            _check_boxes(boxes, mode)
+        self._boxes = boxes
+        self._mode = mode
+        self._N: Optional[List[int]] = None
+        self._data: Optional[torch.Tensor] = None
+
+    def ensure_vertices(self) -> torch.Tensor:
+        """Materialize the boxes as vertices on first call and cache them."""
+        if self._data is None:
+            if isinstance(self._boxes, (list,)):
+                quadrilaterals = [_boxes_to_quadrilaterals(box, self._mode) for box in self._boxes]
+                self._data, self._N = _merge_box_list(quadrilaterals)
+            else:
+                self._data = _boxes_to_quadrilaterals(self._boxes, mode=self._mode)
+        return self._data
+
+    def to_output_mode(self) -> Union[torch.Tensor, List[torch.Tensor]]:
+        """Cast the boxes back to the original ``mode``.
+
+        Boxes that have never been expanded to vertices are returned as floating point copies straight-away.
+        """
+        if self._data is None and not self._mode.startswith("vertices"):
+            if isinstance(self._boxes, (list,)):
+                return [box.clone() if box.is_floating_point() else box.float() for box in self._boxes]
+            return self._boxes.clone() if self._boxes.is_floating_point() else self._boxes.float()
+
+        data = self.ensure_vertices()
+        is_batched = data.ndim == 4
+        boxes = _quadrilaterals_to_boxes(data if is_batched else data.unsqueeze(0), self._mode)
+
+        if self._N is not None:
+            return [torch.nn.functional.pad(
+                o, (len(o.shape) - 1) * [0, 0] + [0, - n]) for o, n in zip(boxes, self._N)]
+        return boxes if is_batched else boxes.squeeze(0)
+
+    @staticmethod
+    def batch_to_output_mode(views: List["BoxesView"]) -> List[Union[torch.Tensor, List[torch.Tensor]]]:
+        """Cast several boxes back to their original ``mode`` at once.
+
+        The batched vertices sharing the same mode, batch size, dtype and device are reduced together.
+        """
+        outputs: List[Union[torch.Tensor, List[torch.Tensor]]] = [None] * len(views)  # type: ignore
+        groups: Dict[Tuple[str, int, torch.dtype, torch.device], List[int]] = {}
+        for i, view in enumerate(views):
+            data = view._data
+            if data is None or view._N is not None or data.ndim != 4:
+                outputs[i] = view.to_output_mode()
+                continue
+            groups.setdefault((view.mode, data.shape[0], data.dtype, data.device), []).append(i)
+
+        for (mode, _, _, _), indices in groups.items():
+            data_list: List[torch.Tensor] = [cast(torch.Tensor, views[i]._data) for i in indices]
+            boxes = _quadrilaterals_to_boxes(torch.cat(data_list, dim=1), mode)
+            for i, out in zip(indices, boxes.split([data.shape[1] for data in data_list], dim=1)):
+                outputs[i] = out
+        return outputs
+
+    @property
+    def data(self) -> torch.Tensor:
+        return self.ensure_vertices()
+
+    @data.setter
+    def data(self, data: torch.Tensor) -> None:
+        self._data = data
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+
 @torch.jit.script
 class Boxes3D:
     r"""3D boxes containing N or BxN boxes.
@@ -6,7 +6,9 @@ import kornia.augmentation as K
 from kornia.augmentation._2d.mix.base import MixAugmentationBase
 from kornia.constants import BorderType
 from kornia.geometry.bbox import bbox_to_mask
+from kornia.geometry.boxes import BoxesView
 from kornia.testing import assert_close
+from kornia.utils._compat import torch_version_geq
 
 
 def reproducibility_test(input, seq):
@@ -225,6 +227,12 @@ class TestAugmentationSequential:
         with pytest.raises(Exception):  # AssertError and NotImplementedError
             K.AugmentationSequential(augmentation_list, data_keys=data_keys)
 
+    def test_unsupported_module_exception(self, device, dtype):
+        inp = torch.randn(1, 3, 5, 6, device=device, dtype=dtype)
+        aug = K.AugmentationSequential(kornia.filters.MedianBlur((3, 3)), data_keys=["input", "mask"])
+        with pytest.raises(NotImplementedError):
+            aug(inp, inp)
+
     @pytest.mark.parametrize('return_transform', [True, False])
     @pytest.mark.parametrize('same_on_batch', [True, False])
     @pytest.mark.parametrize('random_apply', [1, (2, 2), (1, 2), (2,), 10, True, False])
@@ -362,6 +370,31 @@ class TestAugmentationSequential:
         out = aug(input, input)
         assert torch.all(out[1][out[0] == fill_value] == 0.)
 
+    def test_integer_masks(self, device, dtype):
+        input = torch.randn(2, 3, 10, 10, device=device, dtype=dtype)
+        mask_uint8 = torch.randint(0, 255, (2, 1, 10, 10), device=device, dtype=torch.uint8)
+        mask_bool = torch.rand(2, 1, 10, 10, device=device) > 0.5
+        aug = K.AugmentationSequential(
+            K.RandomAffine(30, p=1.), K.RandomErasing(p=1.), data_keys=["input", "mask", "mask", "mask", "mask"],
+        )
+
+        out = aug(
+            input, mask_uint8, mask_bool,
+            mask_uint8.to(torch.get_default_dtype()), mask_bool.to(torch.get_default_dtype())
+        )
+        assert out[1].dtype == torch.uint8
+        assert out[2].dtype == torch.bool
+        assert_close(out[1], out[3].round().to(torch.uint8))
+        assert_close(out[2], out[4].round().to(torch.bool))
+
+        out_inv = aug.inverse(
+            out[0], out[1], out[2], out[1].to(torch.get_default_dtype()), out[2].to(torch.get_default_dtype())
+        )
+        assert out_inv[1].dtype == torch.uint8
+        assert out_inv[2].dtype == torch.bool
+        assert_close(out_inv[1], out_inv[3].round().to(torch.uint8))
+        assert_close(out_inv[2], out_inv[4].round().to(torch.bool))
+
     def test_random_crops(self, device, dtype):
         input = torch.randn(3, 3, 3, 3, device=device, dtype=dtype)
         bbox = torch.tensor(
@@ -584,6 +617,104 @@ class TestAugmentationSequential:
 
         reproducibility_test((inp, mask, bbox, keypoints, bbox_2, bbox_wh, bbox_wh_2), aug)
 
+    def test_modules_replaced(self, device, dtype):
+        inp = torch.randn(2, 3, 5, 6, device=device, dtype=dtype)
+        aug = K.AugmentationSequential(K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=1.0), data_keys=["input", "mask"])
+        out = aug(inp, inp)
+        assert_close(out[1], inp)
+
+        aug[0] = K.RandomAffine(360, p=1.0)
+        out = aug(inp, inp)
+        assert_close(out[0], out[1])
+
+        aug.add_module("flip", K.RandomHorizontalFlip(p=1.0))
+        out = aug(inp, inp)
+        assert_close(out[0], out[1])
+        out_inv = aug.inverse(*out)
+        assert_close(out_inv[0], out_inv[1])
+
+    def test_prefetch_to_device(self, device, dtype):
+        inp = torch.randn(2, 3, 5, 6, dtype=dtype)
+        bbox = torch.tensor([[[1, 1], [2, 1], [2, 2], [1, 2]]], dtype=dtype).expand(2, -1, -1)
+        points = torch.tensor([[[1, 1]]], dtype=dtype).expand(2, -1, -1)
+        aug = K.AugmentationSequential(
+            K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=1.0),
+            K.RandomAffine(360, p=1.0),
+            data_keys=["input", "mask", "bbox", "keypoints"],
+            prefetch_to_device=device,
+        )
+        label = torch.tensor([0, 1])
+        out, out_label = aug(inp, inp, bbox, points, label=label)
+        assert all(o.device == device for o in out)
+        assert out_label.device == device
+
+        if device.type == "cuda":
+            aug.prefetch_to_device = None
+            out_ref, out_label_ref = aug(
+                *(t.to(device) for t in (inp, inp, bbox, points)), label=label.to(device), params=aug._params
+            )
+            for o, o_ref in zip(out, out_ref):
+                assert_close(o, o_ref)
+            assert_close(out_label, out_label_ref)
+
+    @pytest.mark.skipif(not torch_version_geq(1, 10), reason="Meta tensors are not supported.")
+    def test_prefetch_nested(self, dtype):
+        # The meta device stands in for an accelerator, so that the recursion is checked without one.
+        aug = K.AugmentationSequential(K.RandomAffine(360, p=1.0), prefetch_to_device="meta")
+        inp = torch.randn(2, 3, 5, 6, dtype=dtype)
+        mat = torch.eye(3, dtype=dtype).expand(2, -1, -1)
+        on_device = torch.empty(2, 1, 2, device="meta", dtype=dtype)
+        boxes = BoxesView(torch.tensor([[[1, 1, 3, 4]]], dtype=dtype), mode="xyxy")
+
+        out = aug._prefetch(((inp, mat), [on_device, inp], boxes))
+        assert isinstance(out[0], tuple)
+        assert all(o.device.type == "meta" for o in out[0])
+        assert out[1][0] is on_device
+        assert out[1][1].device.type == "meta"
+        assert out[2] is boxes
+
+    def test_outputs_as_boxes(self, device, dtype):
+        inp = torch.randn(2, 3, 5, 6, device=device, dtype=dtype)
+        bbox = torch.tensor([[1, 1, 3, 4]], device=device, dtype=dtype).expand(2, -1, -1)
+        bbox_wh = torch.tensor([[1, 1, 2, 3]], device=device, dtype=dtype).expand(2, -1, -1)
+        aug = K.AugmentationSequential(
+            K.RandomAffine(360, p=1.0), data_keys=["input", "bbox_xyxy", "bbox_xywh"], outputs_as_boxes=True
+        )
+        out = aug(inp, bbox, bbox_wh)
+        assert isinstance(out[1], BoxesView)
+        assert isinstance(out[2], BoxesView)
+
+        aug.outputs_as_boxes = False
+        out_rep = aug(inp, bbox, bbox_wh, params=aug._params)
+        assert_close(out[1].to_output_mode(), out_rep[1])
+        assert_close(out[2].to_output_mode(), out_rep[2])
+
+        # The views keep the transformed vertices, so the inverse recovers the original boxes.
+        aug.outputs_as_boxes = True
+        out_inv = aug.inverse(*out)
+        assert_close(out_inv[1].to_output_mode(), bbox, atol=1e-3, rtol=1e-3)
+        assert_close(out_inv[2].to_output_mode(), bbox_wh, atol=1e-3, rtol=1e-3)
+
+    def test_side_streams(self, device, dtype):
+        if device.type != 'cuda':
+            pytest.skip("Side streams are only used on CUDA.")
+        inp = torch.randn(2, 3, 5, 6, device=device, dtype=dtype)
+        mask = torch.randn(2, 1, 5, 6, device=device, dtype=dtype)
+        bbox = torch.tensor([[[1, 1], [2, 1], [2, 2], [1, 2]]], device=device, dtype=dtype).expand(2, -1, -1, -1)
+        points = torch.tensor([[[1, 1]]], device=device, dtype=dtype).expand(2, -1, -1)
+        aug = K.AugmentationSequential(
+            K.ColorJitter(0.1, 0.1, 0.1, 0.1, p=1.0),
+            K.RandomAffine(360, p=1.0),
+            data_keys=["input", "mask", "bbox", "keypoints"],
+        )
+        assert all(stream is not None for stream in aug._get_key_streams([mask, bbox, points], aug.data_keys[1:]))
+
+        out = aug(inp, mask, bbox, points)
+        aug._get_key_streams = lambda inputs, data_keys: [None] * len(inputs)
+        out_ref = aug(inp, mask, bbox, points, params=aug._params)
+        for o, o_ref in zip(out, out_ref):
+            assert_close(o, o_ref)
+
     @pytest.mark.jit
     @pytest.mark.skip(reason="turn off due to Union Type")
     def test_jit(self, device, dtype):
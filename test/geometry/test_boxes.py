@@ -7,7 +7,7 @@ from torch.autograd import gradcheck
 from torch.testing import assert_allclose
 
 import kornia.testing as utils
-from kornia.geometry.boxes import Boxes, Boxes3D
+from kornia.geometry.boxes import Boxes, Boxes3D, BoxesView
 
 
 class TestBoxes2D:
@@ -382,6 +382,81 @@ class TestTransformBoxes2D:
         assert gradcheck(_wrapper_transform_boxes, (t_boxes, trans_mat), raise_exception=True)
 
 
+class TestBoxesView:
+    @staticmethod
+    def _create_boxes(mode, device, dtype):
+        if mode in ['vertices', 'vertices_plus']:
+            return torch.as_tensor([
+                [[2, 2], [2, 3], [1, 3], [1, 2]], [[1, 1], [4, 1], [4, 5], [1, 5]]
+            ], device=device, dtype=dtype)
+        return torch.as_tensor([[1, 2, 5, 6], [2, 1, 3, 4]], device=device, dtype=dtype)
+
+    @pytest.mark.parametrize('mode', ['xyxy', 'xyxy_plus', 'xywh', 'vertices', 'vertices_plus'])
+    @pytest.mark.parametrize('batched', [False, True])
+    def test_to_output_mode(self, mode, batched, device, dtype):
+        src = self._create_boxes(mode, device, dtype)
+        src = torch.stack([src, src.flip(0)]) if batched else src
+        expected = Boxes.from_tensor(src, mode=mode).to_tensor(mode)
+
+        view = BoxesView(src, mode=mode)
+        out = view.to_output_mode()
+        assert_allclose(out, expected)
+        assert out.data_ptr() != src.data_ptr()
+
+        assert_allclose(view.ensure_vertices(), Boxes.from_tensor(src, mode=mode).data)
+        out = view.to_output_mode()
+        assert out.shape == expected.shape
+        assert_allclose(out, expected)
+
+    @pytest.mark.parametrize('mode', ['xyxy', 'xyxy_plus', 'xywh', 'vertices', 'vertices_plus'])
+    def test_list_to_output_mode(self, mode, device, dtype):
+        src = self._create_boxes(mode, device, dtype)
+        src = [src[:1], src]
+        expected = Boxes.from_tensor(src, mode=mode).to_tensor(mode)
+
+        view = BoxesView(src, mode=mode)
+        view.ensure_vertices()
+        out = view.to_output_mode()
+        assert len(out) == len(expected)
+        for o, e in zip(out, expected):
+            assert o.shape == e.shape
+            assert_allclose(o, e)
+
+    def test_batch_to_output_mode(self, device, dtype):
+        srcs = [
+            (self._create_boxes('xyxy', device, dtype)[None].repeat(2, 1, 1), 'xyxy'),
+            (self._create_boxes('xywh', device, dtype)[None].repeat(2, 1, 1), 'xywh'),
+            (self._create_boxes('xyxy', device, dtype)[None].repeat(2, 3, 1), 'xyxy'),
+            (self._create_boxes('xyxy', device, dtype)[None].repeat(3, 1, 1), 'xyxy'),
+            (self._create_boxes('vertices', device, dtype), 'vertices'),
+            ([self._create_boxes('xyxy', device, dtype)[:1]], 'xyxy'),
+        ]
+        views = [BoxesView(src, mode=mode) for src, mode in srcs]
+        for view in views[:-1]:
+            view.ensure_vertices()
+        views.append(BoxesView(self._create_boxes('xywh', device, dtype), mode='xywh'))
+
+        outs = BoxesView.batch_to_output_mode(views)
+        assert len(outs) == len(views)
+        for out, view in zip(outs, views):
+            expected = view.to_output_mode()
+            if isinstance(expected, list):
+                assert len(out) == len(expected)
+                for o, e in zip(out, expected):
+                    assert_allclose(o, e)
+            else:
+                assert out.shape == expected.shape
+                assert_allclose(out, expected)
+
+    def test_invalid_boxes(self, device, dtype):
+        with pytest.raises(ValueError):
+            BoxesView(torch.as_tensor([[1, 2, 1, 4]], device=device, dtype=dtype), mode='xyxy')  # Zero width
+        with pytest.raises(ValueError):
+            BoxesView(torch.rand(2, 3, 2, device=device, dtype=dtype), mode='xywh')
+        with pytest.raises(ValueError):
+            BoxesView([torch.as_tensor([[1, 2, 0, 3]], device=device, dtype=dtype)], mode='xyxy_plus')
+
+
 class TestBbox3D:
     def test_smoke(self, device, dtype):
         def _create_tensor_box():